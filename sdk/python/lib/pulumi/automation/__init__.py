@@ -91,7 +91,9 @@ conflicts::
 from pulumi.automation._remote_workspace import (
     RemoteWorkspaceOptions,
     RemoteGitAuth,
+    RemoteGitStackSource,
     create_remote_stack_git_source,
+    create_remote_stacks_git_source,
     create_or_select_remote_stack_git_source,
     select_remote_stack_git_source,
 )
@@ -240,7 +242,9 @@ __all__ = [
     # _remote_workspace
     "RemoteWorkspaceOptions",
     "RemoteGitAuth",
+    "RemoteGitStackSource",
     "create_remote_stack_git_source",
+    "create_remote_stacks_git_source",
     "create_or_select_remote_stack_git_source",
     "select_remote_stack_git_source",
     # _remote_stack
@@ -81,6 +81,49 @@ class LocalWorkspaceOptions:
         self.stack_settings = stack_settings
 
 
+class _RemoteConfig:
+    """
+    The settings of a LocalWorkspace whose stack operations are performed remotely.
+    """
+
+    __slots__ = (
+        "env_vars",
+        "pre_run_commands",
+        "git_url",
+        "git_project_path",
+        "git_branch",
+        "git_commit_hash",
+        "git_auth",
+    )
+
+    env_vars: Optional[Mapping[str, Union[str, Secret]]]
+    pre_run_commands: Optional[List[str]]
+    git_url: str
+    git_project_path: Optional[str]
+    git_branch: Optional[str]
+    git_commit_hash: Optional[str]
+    git_auth: Optional[RemoteGitAuth]
+
+    def __init__(
+        self,
+        *,
+        env_vars: Optional[Mapping[str, Union[str, Secret]]],
+        pre_run_commands: Optional[List[str]],
+        git_url: str,
+        git_project_path: Optional[str],
+        git_branch: Optional[str],
+        git_commit_hash: Optional[str],
+        git_auth: Optional[RemoteGitAuth],
+    ):
+        self.env_vars = env_vars
+        self.pre_run_commands = pre_run_commands
+        self.git_url = git_url
+        self.git_project_path = git_project_path
+        self.git_branch = git_branch
+        self.git_commit_hash = git_commit_hash
+        self.git_auth = git_auth
+
+
 class LocalWorkspace(Workspace):
     """
     LocalWorkspace is a default implementation of the Workspace interface.
@@ -94,14 +137,7 @@ class LocalWorkspace(Workspace):
     This is identical to the behavior of Pulumi CLI driven workspaces.
     """
 
-    _remote: bool = False
-    _remote_env_vars: Optional[Mapping[str, Union[str, Secret]]]
-    _remote_pre_run_commands: Optional[List[str]]
-    _remote_git_url: str
-    _remote_git_project_path: Optional[str]
-    _remote_git_branch: Optional[str]
-    _remote_git_commit_hash: Optional[str]
-    _remote_git_auth: Optional[RemoteGitAuth]
+    _remote_config: Optional[_RemoteConfig] = None
 
     def __init__(
         self,
@@ -413,11 +449,9 @@ class LocalWorkspace(Workspace):
             version_string = version_string[1:]
         return version_string
 
-    def _remote_supported(self) -> bool:
-        # See if `--remote` is present in `pulumi preview --help`'s output.
-        result = self._run_pulumi_cmd_sync(["preview", "--help"])
-        help_string = result.stdout.strip()
-        return "--remote" in help_string
+    @property
+    def _remote(self) -> bool:
+        return self._remote_config is not None
 
     def _run_pulumi_cmd_sync(
         self, args: List[str], on_output: Optional[OnOutput] = None
@@ -430,22 +464,23 @@ class LocalWorkspace(Workspace):
 
     def _remote_args(self) -> List[str]:
         args: List[str] = []
-        if not self._remote:
+        config = self._remote_config
+        if config is None:
             return args
 
         args.append("--remote")
-        if self._remote_git_url:
-            args.append(self._remote_git_url)
-        if self._remote_git_project_path:
+        if config.git_url:
+            args.append(config.git_url)
+        if config.git_project_path:
             args.append("--remote-git-repo-dir")
-            args.append(self._remote_git_project_path)
-        if self._remote_git_branch:
+            args.append(config.git_project_path)
+        if config.git_branch:
             args.append("--remote-git-branch")
-            args.append(self._remote_git_branch)
-        if self._remote_git_commit_hash:
+            args.append(config.git_branch)
+        if config.git_commit_hash:
             args.append("--remote-git-commit")
-            args.append(self._remote_git_commit_hash)
-        auth = self._remote_git_auth
+            args.append(config.git_commit_hash)
+        auth = config.git_auth
         if auth is not None:
             if auth.personal_access_token:
                 args.append("--remote-git-auth-access-token")
@@ -463,9 +498,9 @@ class LocalWorkspace(Workspace):
                 args.append("--remote-git-auth-username")
                 args.append(auth.username)
 
-        if self._remote_env_vars is not None:
-            for k in self._remote_env_vars:
-                v = self._remote_env_vars[k]
+        if config.env_vars is not None:
+            for k in config.env_vars:
+                v = config.env_vars[k]
                 if isinstance(v, Secret):
                     args.append("--remote-env-secret")
                     args.append(f"{k}={v}")
@@ -475,8 +510,8 @@ class LocalWorkspace(Workspace):
                 else:
                     raise AssertionError(f"unexpected env value {v} for key '{k}'")
 
-        if self._remote_pre_run_commands is not None:
-            for command in self._remote_pre_run_commands:
+        if config.pre_run_commands is not None:
+            for command in config.pre_run_commands:
                 args.append("--remote-pre-run-command")
                 args.append(command)
 
@@ -12,9 +12,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import List, Mapping, Optional, Union
-
-from pulumi.automation._local_workspace import LocalWorkspace, Secret
+import functools
+import os
+import shutil
+import tempfile
+from concurrent import futures
+from typing import Dict, List, Mapping, Optional, Sequence, Union
+
+from pulumi.automation._cmd import _run_pulumi_cmd
+from pulumi.automation._local_workspace import (
+    _SKIP_VERSION_CHECK_VAR,
+    LocalWorkspace,
+    Secret,
+    _RemoteConfig,
+)
 from pulumi.automation._remote_stack import RemoteStack
 from pulumi.automation._stack import Stack, StackInitMode
 
@@ -89,6 +100,75 @@ class RemoteGitAuth:
         self.username = username
 
 
+class RemoteGitStackSource:
+    """
+    PREVIEW: Describes a Stack backed by a RemoteWorkspace with source code from a Git repository, to be
+    created by create_remote_stacks_git_source. The arguments are the same as those of
+    create_remote_stack_git_source.
+    """
+
+    stack_name: str
+    url: str
+    branch: Optional[str]
+    commit_hash: Optional[str]
+    project_path: Optional[str]
+    auth: Optional[RemoteGitAuth]
+    opts: Optional[RemoteWorkspaceOptions]
+
+    def __init__(
+        self,
+        stack_name: str,
+        url: str,
+        *,
+        branch: Optional[str] = None,
+        commit_hash: Optional[str] = None,
+        project_path: Optional[str] = None,
+        auth: Optional[RemoteGitAuth] = None,
+        opts: Optional[RemoteWorkspaceOptions] = None,
+    ):
+        self.stack_name = stack_name
+        self.url = url
+        self.branch = branch
+        self.commit_hash = commit_hash
+        self.project_path = project_path
+        self.auth = auth
+        self.opts = opts
+
+
+_ERR_COMMIT_AND_BRANCH = "commit_hash and branch cannot both be specified."
+_ERR_NEED_COMMIT_OR_BRANCH = "at least commit_hash or branch are required."
+_ERR_SSH_CONFLICT = "ssh_private_key and ssh_private_key_path cannot both be specified."
+_ERR_CLI_UNSUPPORTED = (
+    "The Pulumi CLI does not support remote operations. Please upgrade."
+)
+
+_COMMIT_HASH = 1 << 0
+_BRANCH = 1 << 1
+_SSH_PRIVATE_KEY = 1 << 2
+_SSH_PRIVATE_KEY_PATH = 1 << 3
+
+
+# Maps each invalid combination of the git source bits above to the error it raises.
+_INVALID_GIT_SOURCE_MASKS: Dict[int, str] = {
+    # Both commit_hash and branch are given.
+    _COMMIT_HASH | _BRANCH: _ERR_COMMIT_AND_BRANCH,
+    _COMMIT_HASH | _BRANCH | _SSH_PRIVATE_KEY: _ERR_COMMIT_AND_BRANCH,
+    _COMMIT_HASH | _BRANCH | _SSH_PRIVATE_KEY_PATH: _ERR_COMMIT_AND_BRANCH,
+    _COMMIT_HASH
+    | _BRANCH
+    | _SSH_PRIVATE_KEY
+    | _SSH_PRIVATE_KEY_PATH: _ERR_COMMIT_AND_BRANCH,
+    # Neither commit_hash nor branch is given.
+    0: _ERR_NEED_COMMIT_OR_BRANCH,
+    _SSH_PRIVATE_KEY: _ERR_NEED_COMMIT_OR_BRANCH,
+    _SSH_PRIVATE_KEY_PATH: _ERR_NEED_COMMIT_OR_BRANCH,
+    _SSH_PRIVATE_KEY | _SSH_PRIVATE_KEY_PATH: _ERR_NEED_COMMIT_OR_BRANCH,
+    # Both ssh_private_key and ssh_private_key_path are given.
+    _COMMIT_HASH | _SSH_PRIVATE_KEY | _SSH_PRIVATE_KEY_PATH: _ERR_SSH_CONFLICT,
+    _BRANCH | _SSH_PRIVATE_KEY | _SSH_PRIVATE_KEY_PATH: _ERR_SSH_CONFLICT,
+}
+
+
 def create_remote_stack_git_source(
     stack_name: str,
     url: str,
@@ -103,10 +183,9 @@ def create_remote_stack_git_source(
     PREVIEW: Creates a Stack backed by a RemoteWorkspace with source code from the specified Git repository.
     Pulumi operations on the stack (Preview, Update, Refresh, and Destroy) are performed remotely.
     """
-    if not _is_fully_qualified_stack_name(stack_name):
-        raise Exception(f'"{stack_name}" stack name must be fully qualified.')
-
-    ws = _create_local_workspace(
+    return _create_remote_stack_git_source(
+        stack_name,
+        StackInitMode.CREATE,
         url=url,
         project_path=project_path,
         branch=branch,
@@ -114,8 +193,6 @@ def create_remote_stack_git_source(
         auth=auth,
         opts=opts,
     )
-    stack = Stack.create(stack_name, ws)
-    return RemoteStack(stack)
 
 
 def create_or_select_remote_stack_git_source(
@@ -132,10 +209,9 @@ def create_or_select_remote_stack_git_source(
     PREVIEW: Creates or selects an existing Stack backed by a RemoteWorkspace with source code from the specified
     Git repository. Pulumi operations on the stack (Preview, Update, Refresh, and Destroy) are performed remotely.
     """
-    if not _is_fully_qualified_stack_name(stack_name):
-        raise Exception(f'"{stack_name}" stack name must be fully qualified.')
-
-    ws = _create_local_workspace(
+    return _create_remote_stack_git_source(
+        stack_name,
+        StackInitMode.CREATE_OR_SELECT,
         url=url,
         project_path=project_path,
         branch=branch,
@@ -143,8 +219,6 @@ def create_or_select_remote_stack_git_source(
         auth=auth,
         opts=opts,
     )
-    stack = Stack.create_or_select(stack_name, ws)
-    return RemoteStack(stack)
 
 
 def select_remote_stack_git_source(
@@ -161,6 +235,57 @@ def select_remote_stack_git_source(
     PREVIEW: Creates or selects an existing Stack backed by a RemoteWorkspace with source code from the specified
     Git repository. Pulumi operations on the stack (Preview, Update, Refresh, and Destroy) are performed remotely.
     """
+    return _create_remote_stack_git_source(
+        stack_name,
+        StackInitMode.SELECT,
+        url=url,
+        project_path=project_path,
+        branch=branch,
+        commit_hash=commit_hash,
+        auth=auth,
+        opts=opts,
+    )
+
+
+def create_remote_stacks_git_source(
+    sources: Sequence[RemoteGitStackSource],
+) -> List[RemoteStack]:
+    """
+    PREVIEW: Creates a Stack backed by a RemoteWorkspace for each of the given sources concurrently, as
+    create_remote_stack_git_source does for one. The stacks are returned in the same order as sources.
+    """
+    if not sources:
+        return []
+
+    # Probe the CLI once up front so the concurrent creations all share the cached result.
+    if not _remote_cli_check_skipped():
+        _check_remote_cli_support()
+
+    def create(source: RemoteGitStackSource) -> RemoteStack:
+        return create_remote_stack_git_source(
+            source.stack_name,
+            source.url,
+            branch=source.branch,
+            commit_hash=source.commit_hash,
+            project_path=source.project_path,
+            auth=source.auth,
+            opts=source.opts,
+        )
+
+    with futures.ThreadPoolExecutor(max_workers=min(32, len(sources))) as executor:
+        return list(executor.map(create, sources))
+
+
+def _create_remote_stack_git_source(
+    stack_name: str,
+    mode: StackInitMode,
+    url: str,
+    branch: Optional[str] = None,
+    commit_hash: Optional[str] = None,
+    project_path: Optional[str] = None,
+    auth: Optional[RemoteGitAuth] = None,
+    opts: Optional[RemoteWorkspaceOptions] = None,
+) -> RemoteStack:
     if not _is_fully_qualified_stack_name(stack_name):
         raise Exception(f'"{stack_name}" stack name must be fully qualified.')
 
@@ -172,7 +297,7 @@ def select_remote_stack_git_source(
         auth=auth,
         opts=opts,
     )
-    stack = Stack.select(stack_name, ws)
+    stack = Stack(stack_name, ws, mode)
     return RemoteStack(stack)
 
 
@@ -185,15 +310,19 @@ def _create_local_workspace(
     opts: Optional[RemoteWorkspaceOptions] = None,
 ) -> LocalWorkspace:
 
-    if commit_hash is not None and branch is not None:
-        raise Exception("commit_hash and branch cannot both be specified.")
-    if commit_hash is None and branch is None:
-        raise Exception("at least commit_hash or branch are required.")
+    mask = 0
+    if commit_hash is not None:
+        mask |= _COMMIT_HASH
+    if branch is not None:
+        mask |= _BRANCH
     if auth is not None:
-        if auth.ssh_private_key is not None and auth.ssh_private_key_path is not None:
-            raise Exception(
-                "ssh_private_key and ssh_private_key_path cannot both be specified."
-            )
+        if auth.ssh_private_key is not None:
+            mask |= _SSH_PRIVATE_KEY
+        if auth.ssh_private_key_path is not None:
+            mask |= _SSH_PRIVATE_KEY_PATH
+    message = _INVALID_GIT_SOURCE_MASKS.get(mask)
+    if message is not None:
+        raise Exception(message)
 
     env_vars = None
     pre_run_commands = None
@@ -201,25 +330,64 @@ def _create_local_workspace(
         env_vars = opts.env_vars
         pre_run_commands = opts.pre_run_commands
 
+    # Ensure the CLI supports --remote before spawning it to construct the workspace.
+    if not _remote_cli_check_skipped() and not _check_remote_cli_support():
+        raise Exception(_ERR_CLI_UNSUPPORTED)
+
     ws = LocalWorkspace()
-    ws._remote = True
-    ws._remote_env_vars = env_vars
-    ws._remote_pre_run_commands = pre_run_commands
-    ws._remote_git_url = url
-    ws._remote_git_project_path = project_path
-    ws._remote_git_branch = branch
-    ws._remote_git_commit_hash = commit_hash
-    ws._remote_git_auth = auth
-
-    # Ensure the CLI supports --remote.
-    if not ws._version_check_opt_out() and not ws._remote_supported():
-        raise Exception(
-            "The Pulumi CLI does not support remote operations. Please upgrade."
-        )
+    ws._remote_config = _RemoteConfig(
+        env_vars=env_vars,
+        pre_run_commands=pre_run_commands,
+        git_url=url,
+        git_project_path=project_path,
+        git_branch=branch,
+        git_commit_hash=commit_hash,
+        git_auth=auth,
+    )
 
     return ws
 
 
+def _remote_cli_check_skipped() -> bool:
+    """
+    Returns whether checking the Pulumi CLI for remote operation support has been opted out of. The
+    remote workspace has no env_vars of its own, so only the process environment can opt out.
+    """
+    return os.getenv(_SKIP_VERSION_CHECK_VAR) is not None
+
+
+def _check_remote_cli_support() -> bool:
+    """
+    Returns whether the Pulumi CLI on the PATH supports remote operations.
+    The result is cached for the lifetime of the process, keyed on the location and modification
+    time of the CLI binary so that an upgraded CLI is probed again.
+    """
+    pulumi_path = shutil.which("pulumi")
+    mtime: Optional[float] = None
+    if pulumi_path is not None:
+        try:
+            mtime = os.stat(pulumi_path).st_mtime
+        except OSError:
+            pass
+    return _remote_supported(pulumi_path, mtime)
+
+
+@functools.lru_cache(maxsize=None)
+def _remote_supported(pulumi_path: Optional[str], mtime: Optional[float]) -> bool:
+    # pylint: disable=unused-argument
+    # pulumi_path and mtime are only used as the cache key.
+    # See if `--remote` is present in `pulumi preview --help`'s output.
+    result = _run_pulumi_cmd(
+        ["preview", "--help"], tempfile.gettempdir(), {"PULUMI_EXPERIMENTAL": "true"}
+    )
+    help_string = result.stdout.strip()
+    return "--remote" in help_string
+
+
 def _is_fully_qualified_stack_name(stack: str) -> bool:
-    split = stack.split("/")
-    return len(split) == 3 and split[0] != "" and split[1] != "" and split[2] != ""
+    return (
+        stack.count("/") == 2
+        and not stack.startswith("/")
+        and not stack.endswith("/")
+        and "//" not in stack
+    )
@@ -16,11 +16,15 @@
 
 import asyncio
 import copy
+import functools
+import itertools
 import warnings
+from types import MappingProxyType
 from typing import (
     Optional,
     List,
     Any,
+    Dict,
     Mapping,
     Sequence,
     Union,
@@ -31,7 +35,6 @@ from typing import (
     cast,
 )
 from . import _types
-from .metadata import get_project, get_stack
 from .runtime import known_types
 from .runtime.resource import (
     get_resource,
@@ -40,9 +43,8 @@ from .runtime.resource import (
     read_resource,
     convert_providers,
 )
-from .runtime.settings import get_root_resource
+from .runtime.settings import get_project, get_root_resource, get_stack
 from .output import _is_prompt, _map_input, _map2_input, T, Output
-from . import urn as urn_util
 from . import log
 
 if TYPE_CHECKING:
@@ -86,6 +88,44 @@ def inherited_child_alias(
     applied to it's parent. This may involve changing the name of the resource in cases where the
     resource has a named derived from the name of the parent, and the parent name changed.
     """
+    return _inherited_child_alias(
+        child_name,
+        child_name.startswith(parent_name),
+        len(parent_name),
+        _child_urn_prefix(parent_alias),
+        _alias_name(parent_alias),
+        child_type,
+    )
+
+
+def _alias_name(alias: "Input[str]") -> "Output[str]":
+    """
+    Returns the name part of the given alias URN.
+    """
+    return Output.from_input(alias).apply(lambda u: u[u.rfind("::") + 2 :])
+
+
+def _child_urn_prefix(parent_urn: "Input[str]") -> "Output[str]":
+    """
+    Returns the prefix that the URNs of the children of the resource with the given URN start with.
+    """
+    return Output.from_input(parent_urn).apply(lambda u: u[0 : u.rfind("::")] + "$")
+
+
+def _inherited_child_alias(
+    child_name: str,
+    child_has_parent_prefix: bool,
+    parent_name_len: int,
+    parent_alias_prefix: "Output[str]",
+    parent_alias_name: "Output[str]",
+    child_type: str,
+) -> "Output[str]":
+    """
+    Like inherited_child_alias, but takes whether the child name starts with the parent name, the
+    length of the parent name, the child URN prefix of the parent alias (see _child_urn_prefix) and
+    the name part of the parent alias (see _alias_name) precomputed, so that they can be shared by
+    every alias inherited from the same parent.
+    """
 
     #   If the child name has the parent name as a prefix, then we make the assumption that it was
     #   constructed from the convention of using `{name}-details` as the name of the child resource.  To
@@ -100,19 +140,29 @@ def inherited_child_alias(
     #   * aliasName: "app-function"
     #   * childAlias: "urn:pulumi:stackname::projectname::aws:s3/bucket:Bucket::app-function"
     alias_name = Output.from_input(child_name)
-    if child_name.startswith(parent_name):
-        alias_name = Output.from_input(parent_alias).apply(
-            lambda u: u[u.rfind("::") + 2 :] + child_name[len(parent_name) :]
-        )
+    if child_has_parent_prefix:
+        alias_name = parent_alias_name.apply(lambda n: n + child_name[parent_name_len:])
 
-    return create_urn(alias_name, child_type, parent_alias)
+    return _create_urn_with_prefix(alias_name, child_type, parent_alias_prefix)
 
 
 # Extract the type and name parts of a URN
+@functools.lru_cache(maxsize=2048)
 def urn_type_and_name(urn: str) -> Tuple[str, str]:
-    parts = urn.split("::")
-    type_parts = parts[2].split("$")
-    return (parts[3], type_parts[-1])
+    # The name is everything after the type, so it may itself contain "::".
+    parts = urn.split("::", 3)
+    return (parts[3], parts[2].rpartition("$")[2])
+
+
+# Split a resource type token into its package, module and member parts, or None if it is not of the
+# form `pkg:mod:member`.
+@functools.lru_cache(maxsize=4096)
+def _parse_type(t: str) -> Optional[Tuple[str, str, str]]:
+    components = t.split(":")
+    if len(components) != 3:
+        return None
+    pkg, mod, member = components
+    return (pkg, mod, member)
 
 
 def all_aliases(
@@ -126,39 +176,40 @@ def all_aliases(
     If there are N child aliases, and M parent aliases, there will be (M+1)*(N+1)-1 total aliases,
     or, as calculated in the logic below, N+(M*(1+N)).
     """
-    aliases: "List[Input[str]]" = []
+    if not child_aliases and (parent is None or not parent._aliases):
+        return []
 
-    for child_alias in child_aliases or []:
-        aliases.append(
-            collapse_alias_to_urn(child_alias, child_name, child_type, parent)
-        )
+    child_alias_urns = [
+        collapse_alias_to_urn(child_alias, child_name, child_type, parent)
+        for child_alias in child_aliases or ()
+    ]
+    aliases: "List[Input[str]]" = list(child_alias_urns)
 
     if parent is not None:
         parent_name = parent._name
-        for parent_alias in parent._aliases:
+        parent_name_len = len(parent_name)
+        child_has_parent_prefix = child_name.startswith(parent_name)
+        for parent_alias_prefix, parent_alias_name in zip(
+            parent._get_alias_prefixes(), parent._get_alias_names()
+        ):
             aliases.append(
-                inherited_child_alias(
-                    child_name, parent._name, parent_alias, child_type
+                _inherited_child_alias(
+                    child_name,
+                    child_has_parent_prefix,
+                    parent_name_len,
+                    parent_alias_prefix,
+                    parent_alias_name,
+                    child_type,
                 )
             )
-            for child_alias in child_aliases or []:
-                child_alias_urn = collapse_alias_to_urn(
-                    child_alias, child_name, child_type, parent
-                )
-
-                def inherited_alias_for_child_urn(
-                    child_alias_urn: str, parent_alias=parent_alias
-                ) -> "Output[str]":
-                    aliased_child_name, aliased_child_type = urn_type_and_name(
-                        child_alias_urn
-                    )
-                    return inherited_child_alias(
-                        aliased_child_name,
-                        parent_name,
-                        parent_alias,
-                        aliased_child_type,
-                    )
-
+            inherited_alias_for_child_urn = functools.partial(
+                _inherited_alias_for_child_urn,
+                parent_name=parent_name,
+                parent_name_len=parent_name_len,
+                parent_alias_prefix=parent_alias_prefix,
+                parent_alias_name=parent_alias_name,
+            )
+            for child_alias_urn in child_alias_urns:
                 inherited_alias: Output[str] = child_alias_urn.apply(
                     inherited_alias_for_child_urn
                 )
@@ -167,6 +218,24 @@ def all_aliases(
     return aliases
 
 
+def _inherited_alias_for_child_urn(
+    child_alias_urn: str,
+    parent_name: str,
+    parent_name_len: int,
+    parent_alias_prefix: "Output[str]",
+    parent_alias_name: "Output[str]",
+) -> "Output[str]":
+    aliased_child_name, aliased_child_type = urn_type_and_name(child_alias_urn)
+    return _inherited_child_alias(
+        aliased_child_name,
+        aliased_child_name.startswith(parent_name),
+        parent_name_len,
+        parent_alias_prefix,
+        parent_alias_name,
+        aliased_child_type,
+    )
+
+
 ROOT_STACK_RESOURCE = None
 """
 Constant to represent the 'root stack' resource for a Pulumi application.  The purpose of this is
@@ -269,15 +338,33 @@ def collapse_alias_to_urn(
     collapse_alias_to_urn turns an Alias into a URN given a set of default data
     """
 
+    # A plain string is already a URN, so there is nothing to collapse.
+    if isinstance(alias, str):
+        return Output.from_input(alias)
+
     def collapse_alias_to_urn_worker(inner: Union[Alias, str]) -> Output[str]:
         if isinstance(inner, str):
             return Output.from_input(inner)
 
-        name = inner.name if inner.name is not ... else defaultName  # type: ignore
-        type_ = inner.type_ if inner.type_ is not ... else defaultType  # type: ignore
-        parent = inner.parent if inner.parent is not ... else defaultParent  # type: ignore
-        project: str = inner.project if inner.project is not ... else get_project()  # type: ignore
-        stack: str = inner.stack if inner.stack is not ... else get_stack()  # type: ignore
+        # Read each attribute once, then fill in the defaults for the ones left unset (`...`).
+        # project and stack are only looked up when actually needed.
+        name, type_, parent, project, stack = (
+            inner.name,
+            inner.type_,
+            inner.parent,
+            inner.project,
+            inner.stack,
+        )
+        if name is ...:
+            name = defaultName
+        if type_ is ...:
+            type_ = defaultType
+        if parent is ...:
+            parent = defaultParent
+        if project is ...:
+            project = get_project()
+        if stack is ...:
+            stack = get_stack()
 
         if name is None:
             raise Exception("No valid 'name' passed in for alias.")
@@ -285,7 +372,7 @@ def collapse_alias_to_urn(
         if type_ is None:
             raise Exception("No valid 'type_' passed in for alias.")
 
-        return create_urn(name, type_, parent, project, stack)
+        return create_urn(name, type_, parent, project, stack)  # type: ignore
 
     inputAlias: Output[Union[Alias, str]] = Output.from_input(alias)
     return inputAlias.apply(collapse_alias_to_urn_worker)
@@ -296,6 +383,8 @@ class ResourceTransformationArgs:
     ResourceTransformationArgs is the argument bag passed to a resource transformation.
     """
 
+    __slots__ = ("resource", "type_", "name", "props", "opts")
+
     resource: "Resource"
     """
     The Resource instance that is being transformed.
@@ -343,6 +432,8 @@ class ResourceTransformationResult:
     the originally provided values.
     """
 
+    __slots__ = ("props", "opts")
+
     props: "Inputs"
     """
     The new properties to use in place of the original `props`.
@@ -371,6 +462,10 @@ this indicates that the resource will not be transformed.
 """
 
 
+# Sentinel for searches that may legitimately find None.
+_NOT_FOUND = object()
+
+
 class ResourceOptions:
     """
     ResourceOptions is a bag of optional settings that control a resource's behavior.
@@ -563,11 +658,6 @@ class ResourceOptions:
                if specified resource is being deleted as well.
         """
 
-        # Expose 'merge' again this this object, but this time as an instance method.
-        # TODO[python/mypy#2427]: mypy disallows method assignment
-        self.merge = self._merge_instance  # type: ignore
-        self.merge.__func__.__doc__ = ResourceOptions.merge.__doc__  # type: ignore
-
         self.parent = parent
         self.protect = protect
         self.provider = provider
@@ -593,14 +683,26 @@ class ResourceOptions:
         # and can only do it on promptly available arguments.
         deps = self._depends_on_list()
         if isinstance(deps, list):
-            for dep in deps:
-                if _is_prompt(dep) and not isinstance(dep, Resource):
-                    raise Exception(
-                        f"'depends_on' was passed a value {dep} that was not a Resource."
-                    )
+            invalid_dep = next(
+                (d for d in deps if _is_prompt(d) and not isinstance(d, Resource)),
+                _NOT_FOUND,
+            )
+            if invalid_dep is not _NOT_FOUND:
+                raise Exception(
+                    f"'depends_on' was passed a value {invalid_dep} that was not a Resource."
+                )
 
-    def _merge_instance(self, opts: "ResourceOptions") -> "ResourceOptions":
-        return ResourceOptions.merge(self, opts)
+    def _shallow_clone(self) -> "ResourceOptions":
+        """
+        Returns a shallow copy of these options. Plain ResourceOptions are copied directly through
+        their __dict__, which is much cheaper than going through the `copy` module.
+        """
+        if self.__class__ is not ResourceOptions:
+            # Subclasses may declare their own __slots__ or copy hooks, which copy.copy handles.
+            return copy.copy(self)
+        clone = ResourceOptions.__new__(ResourceOptions)
+        clone.__dict__.update(self.__dict__)
+        return clone
 
     def _depends_on_list(self) -> "Input[List[Input[Resource]]]":
 
@@ -609,12 +711,12 @@ class ResourceOptions:
 
         return _map_input(
             self.depends_on,
-            lambda x: list(x) if isinstance(x, Sequence) else [cast(Any, x)],
+            lambda x: list(x) if isinstance(x, (list, tuple)) else [cast(Any, x)],
         )
 
-    # pylint: disable=method-hidden
-    @staticmethod
-    def merge(
+    # merge is deliberately not a staticmethod: as a plain function it can be called both as
+    # `ResourceOptions.merge(opts1, opts2)` and, bound to `opts1`, as `opts1.merge(opts2)`.
+    def merge(  # pylint: disable=no-self-argument
         opts1: Optional["ResourceOptions"], opts2: Optional["ResourceOptions"]
     ) -> "ResourceOptions":
         """
@@ -643,33 +745,19 @@ class ResourceOptions:
         `opts1` may be `None` so the caller does not need to check for this case.
         """
 
-        opts1 = ResourceOptions() if opts1 is None else opts1
-        opts2 = ResourceOptions() if opts2 is None else opts2
+        base = ResourceOptions() if opts1 is None else opts1
+        source = ResourceOptions() if opts2 is None else opts2
 
-        if not isinstance(opts1, ResourceOptions):
+        if not isinstance(base, ResourceOptions):
             raise TypeError("Expected opts1 to be a ResourceOptions instance")
 
-        if not isinstance(opts2, ResourceOptions):
+        if not isinstance(source, ResourceOptions):
             raise TypeError("Expected opts2 to be a ResourceOptions instance")
 
-        dest = copy.copy(opts1)
-        source = copy.copy(opts2)
-
-        # This makes merging simple.
-        def expand_providers(providers) -> Optional[Sequence["ProviderResource"]]:
-            if isinstance(providers, Mapping):
-                for k, p in providers.items():
-                    if k != p.package:
-                        message = f"Provider map key {k} disagrees with associated provider {p.package}. Key will be ignored."
-                        warnings.warn(message, UserWarning)
-                        log.warn(message)
-                return list(providers.values())
-            return providers
+        # source is only read from, so unlike dest it does not need to be cloned.
+        dest = base._shallow_clone()
 
-        dest_providers = expand_providers(dest.providers)
-        source_providers = expand_providers(source.providers)
-
-        dest.providers = _merge_lists(dest_providers, source_providers)
+        dest.providers = _collapse_providers(dest.providers, source.providers)
 
         dest.depends_on = _map2_input(
             dest._depends_on_list(), source._depends_on_list(), lambda xs, ys: xs + ys
@@ -687,76 +775,92 @@ class ResourceOptions:
             dest.transformations, source.transformations
         )
 
-        dest.parent = dest.parent if source.parent is None else source.parent
-        dest.protect = dest.protect if source.protect is None else source.protect
-        dest.delete_before_replace = (
-            dest.delete_before_replace
-            if source.delete_before_replace is None
-            else source.delete_before_replace
-        )
-        dest.version = dest.version if source.version is None else source.version
-        dest.plugin_download_url = (
-            dest.plugin_download_url
-            if source.plugin_download_url is None
-            else source.plugin_download_url
-        )
-        dest.custom_timeouts = (
-            dest.custom_timeouts
-            if source.custom_timeouts is None
-            else source.custom_timeouts
-        )
-        dest.id = dest.id if source.id is None else source.id
-        dest.import_ = dest.import_ if source.import_ is None else source.import_
-        dest.urn = dest.urn if source.urn is None else source.urn
-        dest.provider = dest.provider if source.provider is None else source.provider
-        dest.retain_on_delete = (
-            dest.retain_on_delete
-            if source.retain_on_delete is None
-            else source.retain_on_delete
-        )
-        dest.deleted_with = (
-            dest.deleted_with if source.deleted_with is None else source.deleted_with
-        )
-
-        # Now, if we are left with a .providers that is just a single key/value pair, then
-        # collapse that down into .provider form.
-        _collapse_providers(dest)
+        for attr in _SCALAR_MERGE_FIELDS:
+            value = getattr(source, attr)
+            if value is not None:
+                setattr(dest, attr, value)
 
         return dest
 
 
-def _collapse_providers(opts: "ResourceOptions"):
+# The ResourceOptions attributes for which ResourceOptions.merge takes the value from opts2 unless it
+# is None.
+_SCALAR_MERGE_FIELDS = (
+    "parent",
+    "protect",
+    "delete_before_replace",
+    "version",
+    "plugin_download_url",
+    "custom_timeouts",
+    "id",
+    "import_",
+    "urn",
+    "provider",
+    "retain_on_delete",
+    "deleted_with",
+)
+
+
+def _collapse_providers(
+    dest: Optional[
+        Union[Mapping[str, "ProviderResource"], Sequence["ProviderResource"]]
+    ],
+    source: Optional[
+        Union[Mapping[str, "ProviderResource"], Sequence["ProviderResource"]]
+    ],
+) -> Optional[Mapping[str, "ProviderResource"]]:
     """
-    If we have 0 providers, we set .providers to None. Otherwise, we ensure that
-    .providers is returned as a map.
+    Merges the providers of `source` over those of `dest` into a single map keyed by package.
+    If we have 0 providers, returns None.
     """
+    providers: Dict[str, "ProviderResource"] = {
+        prov.package: prov
+        for prov in itertools.chain(_expand_providers(dest), _expand_providers(source))
+    }
+    return providers or None
+
+
+def _expand_providers(
     providers: Optional[
-        Union[Mapping[str, ProviderResource], Sequence[ProviderResource]]
-    ] = opts.providers
-    if providers is not None:
-        provider_length = len(providers)
-        if provider_length == 0:
-            opts.providers = None
-        else:
-            opts.providers = {}
-            if isinstance(providers, list):
-                for prov in providers:
-                    opts.providers[prov.package] = prov
-            elif isinstance(providers, dict):
-                for key, prov in providers:
-                    opts.providers[key] = prov
+        Union[Mapping[str, "ProviderResource"], Sequence["ProviderResource"]]
+    ]
+) -> Sequence["ProviderResource"]:
+    if providers is None:
+        return []
+    if isinstance(providers, Mapping):
+        for k, p in providers.items():
+            if k != p.package:
+                message = f"Provider map key {k} disagrees with associated provider {p.package}. Key will be ignored."
+                warnings.warn(message, UserWarning)
+                log.warn(message)
+        return list(providers.values())
+    return providers
 
 
 def _merge_lists(dest, source):
+    """
+    Concatenates `dest` and `source`. If either side is None or empty, the other side is returned
+    as is rather than copied, so the result must not be mutated.
+    """
     if dest is None:
         return source
 
     if source is None:
         return dest
 
+    if not dest:
+        return source
+
+    if not source:
+        return dest
+
     return dest + source
 
 
+# The providers map of resources that neither inherit nor specify any providers.
+_EMPTY_PROVIDERS: Mapping[str, "ProviderResource"] = MappingProxyType({})
+
+
 # !!! IMPORTANT !!! If you add a new attribute to this type, make sure to verify that ResourceOptions.merge
 # works properly for it.
 class Resource:
@@ -766,7 +870,8 @@ class Resource:
 
     _providers: Mapping[str, "ProviderResource"]
     """
-    The set of providers to use for child resources. Keyed by package name (e.g. "aws").
+    The set of providers to use for child resources. Keyed by package name (e.g. "aws"). This is a
+    read-only view that may be shared with the resource's parent and children.
     """
 
     _provider: Optional["ProviderResource"]
@@ -789,11 +894,23 @@ class Resource:
     A collection of transformations to apply as part of resource registration.
     """
 
-    _aliases: "List[Input[str]]"
+    _aliases: "Sequence[Input[str]]"
     """
     A list of aliases applied to this resource.
     """
 
+    _alias_names: "Optional[List[Output[str]]]"
+    """
+    The name part of each of the aliases applied to this resource, computed on first use by
+    _get_alias_names.
+    """
+
+    _alias_prefixes: "Optional[List[Output[str]]]"
+    """
+    The child URN prefix of each of the aliases applied to this resource, computed on first use by
+    _get_alias_prefixes.
+    """
+
     _name: str
     """
     The name assigned to the resource at construction.
@@ -804,7 +921,10 @@ class Resource:
     The specified download URL associated with the provider or None.
     """
 
-    _childResources: Set["Resource"]
+    _childResources: Optional[Set["Resource"]]
+    """
+    The resources parented to this resource, or None until the first child is constructed.
+    """
 
     # !!! IMPORTANT !!! If you add a new attribute to this type, make sure to verify that ResourceOptions.merge
     # works properly for it.
@@ -834,8 +954,7 @@ class Resource:
         """
 
         if dependency:
-            self._protect = False
-            self._providers = {}
+            self._init_dependency()
             return
 
         if props is None:
@@ -869,10 +988,15 @@ class Resource:
         parent = opts.parent
         if parent is None:
             parent = get_root_resource()
-        parent_transformations = (
-            (parent._transformations or []) if parent is not None else []
+        # Every constructed resource has a list of transformations, possibly empty. These lists are
+        # replaced rather than mutated (see register_stack_transformation), so a resource without
+        # transformations of its own can share its parent's list.
+        parent_transformations = parent._transformations if parent is not None else []
+        self._transformations = (
+            opts.transformations + parent_transformations
+            if opts.transformations
+            else parent_transformations
         )
-        self._transformations = (opts.transformations or []) + parent_transformations
         for transformation in self._transformations:
             args = ResourceTransformationArgs(
                 resource=self, type_=t, name=name, props=props, opts=opts
@@ -895,17 +1019,20 @@ class Resource:
         self._name = name
 
         # Make a shallow clone of opts to ensure we don't modify the value passed in.
-        opts = copy.copy(opts)
+        opts = opts._shallow_clone()
 
-        self._providers = {}
-        self._childResources = set()
+        self._providers = _EMPTY_PROVIDERS
+        self._childResources = None
 
         # Check the parent type if one exists and fill in any default options.
         if opts.parent is not None:
             if not isinstance(opts.parent, Resource):
                 raise TypeError("Resource parent is not a valid Resource")
 
-            # Add this resource to its parent's set of child resources.
+            # Add this resource to its parent's set of child resources. Most resources never have
+            # children, so the set is only allocated once they do.
+            if opts.parent._childResources is None:
+                opts.parent._childResources = set()
             opts.parent._childResources.add(self)
 
             # Infer protection from parent, if one was provided.
@@ -915,10 +1042,8 @@ class Resource:
             # Infer providers and provider maps from parent, if one was provided.
             self._providers = opts.parent._providers
 
-        type_components = t.split(":")
-        pkg = None
-        if len(type_components) == 3:
-            [pkg, _, _] = type_components
+        type_components = _parse_type(t)
+        pkg = type_components[0] if type_components is not None else None
 
         opts.provider, providers = self._get_providers(t, pkg, opts)
 
@@ -938,7 +1063,14 @@ class Resource:
         self._providers = providers
         self._version = opts.version
         self._plugin_download_url = opts.plugin_download_url
-        self._aliases = all_aliases(opts.aliases, name, t, opts.parent)
+        # A parent's aliases already include those it inherited, so if neither this resource nor its
+        # parent has any there is nothing to compute.
+        if opts.aliases or (opts.parent is not None and opts.parent._aliases):
+            self._aliases = all_aliases(opts.aliases, name, t, opts.parent)
+        else:
+            self._aliases = ()
+        self._alias_names = None
+        self._alias_prefixes = None
 
         if opts.urn is not None:
             # This is a resource that already exists. Read its state from the engine.
@@ -955,6 +1087,15 @@ class Resource:
                 self, t, name, custom, remote, DependencyResource, props, opts, typ
             )
 
+    def _init_dependency(self) -> None:
+        """
+        Initializes the little state a synthetic resource used internally for dependency tracking
+        needs. The dependency resources call this directly rather than going through the regular
+        constructor chain.
+        """
+        self._protect = False
+        self._providers = _EMPTY_PROVIDERS
+
     def _get_providers(
         self, t: str, pkg: Optional[str], opts: ResourceOptions
     ) -> Tuple[Optional["ProviderResource"], Mapping[str, "ProviderResource"]]:
@@ -973,12 +1114,23 @@ class Resource:
 
         Does not mutate self.
         """
-        if isinstance(opts.providers, Sequence):
-            opts_providers = {p.package: p for p in opts.providers}
-        elif opts.providers:
-            opts_providers = {**opts.providers}
-        else:
+        # Check for the concrete types callers actually pass before falling back to the (much
+        # slower) abstract base class checks.
+        opts_providers: Dict[str, ProviderResource]
+        providers_opt = opts.providers
+        providers_type = type(providers_opt)
+        if not providers_opt:
             opts_providers = {}
+        elif providers_type is list or providers_type is tuple:
+            opts_providers = {
+                p.package: p for p in cast(Sequence[ProviderResource], providers_opt)
+            }
+        elif providers_type is dict:
+            opts_providers = cast(Dict[str, ProviderResource], providers_opt).copy()
+        elif isinstance(providers_opt, Sequence):
+            opts_providers = {p.package: p for p in providers_opt}
+        else:
+            opts_providers = {**providers_opt}
 
         # The provider provided by opts.providers
         ambient_provider: Optional[ProviderResource] = None
@@ -1005,11 +1157,35 @@ class Resource:
             else:
                 opts_providers[pkg] = opts.provider
 
-        # opts_providers takes priority over self._providers
-        providers = {**self._providers, **opts_providers}
+        # Without any overrides this resource shares its parent's providers map rather than copying
+        # it. This is safe because `_providers` is always a read-only mapping.
+        if not opts_providers:
+            return provider, self._providers
+
+        # opts_providers takes priority over self._providers. The result is read-only so that it can be
+        # shared with children that do not override any providers.
+        providers = MappingProxyType({**self._providers, **opts_providers})
 
         return provider, providers
 
+    def _get_alias_names(self) -> "List[Output[str]]":
+        """
+        Returns the name part of each of this resource's aliases. These are shared by all of the
+        resource's children when computing the aliases they inherit, so they are only computed once.
+        """
+        if self._alias_names is None:
+            self._alias_names = [_alias_name(alias) for alias in self._aliases]
+        return self._alias_names
+
+    def _get_alias_prefixes(self) -> "List[Output[str]]":
+        """
+        Returns the prefix that the URNs of children of each of this resource's aliases start with.
+        Like _get_alias_names, these are shared by all of the resource's children.
+        """
+        if self._alias_prefixes is None:
+            self._alias_prefixes = [_child_urn_prefix(alias) for alias in self._aliases]
+        return self._alias_prefixes
+
     @property
     def urn(self) -> "Output[str]":
         """
@@ -1059,12 +1235,11 @@ class Resource:
         :return: The :class:`ProviderResource` associated with the given module member, or None if one does not exist.
         :rtype: Optional[ProviderResource]
         """
-        components = module_member.split(":")
-        if len(components) != 3:
+        components = _parse_type(module_member)
+        if components is None:
             return None
 
-        [pkg, _, _] = components
-        return self._providers.get(pkg)
+        return self._providers.get(components[0])
 
 
 class CustomResource(Resource):
@@ -1180,22 +1355,67 @@ class ProviderResource(CustomResource):
         self.package = pkg
 
 
+# Already resolved True and False futures, shared as the known and secret flags of the outputs of
+# every dependency resource. A completed future can be awaited any number of times, so one pair is
+# enough for as long as the event loop stays the same.
+_RESOLVED_FLAGS: "Optional[Tuple[asyncio.Future[bool], asyncio.Future[bool]]]" = None
+
+
+def _resolved_future(loop: asyncio.AbstractEventLoop, value: T) -> "asyncio.Future[T]":
+    """
+    Returns a future bound to `loop` that is already resolved to `value`.
+    """
+    future: asyncio.Future[T] = loop.create_future()
+    future.set_result(value)
+    return future
+
+
+def _resolved_flags(
+    loop: asyncio.AbstractEventLoop,
+) -> "Tuple[asyncio.Future[bool], asyncio.Future[bool]]":
+    """
+    Returns resolved futures for True and False bound to `loop`.
+    """
+    global _RESOLVED_FLAGS  # pylint: disable=global-statement
+    # Read the cached pair only once: another thread running its own event loop may replace it
+    # concurrently, so it must not be read again after checking its loop.
+    flags = _RESOLVED_FLAGS
+    if flags is None or flags[0].get_loop() is not loop:
+        flags = (_resolved_future(loop, True), _resolved_future(loop, False))
+        _RESOLVED_FLAGS = flags
+    return flags
+
+
+def _dependency_output(res: "Resource", key: str, value: str) -> "Output[str]":
+    """
+    Returns the `key` ("urn" or "id") output of a dependency resource, resolved to `value`. Many
+    dependency resources never have their URN or ID read, so the output is only created on first use
+    and then stored where the `urn` and `id` properties of other resources keep theirs.
+    """
+    output = res.__dict__.get(key)
+    if output is None:
+        loop = asyncio.get_event_loop()
+        known, not_secret = _resolved_flags(loop)
+        output = Output({res}, _resolved_future(loop, value), known, not_secret)
+        res.__dict__[key] = output
+    return output
+
+
 class DependencyResource(CustomResource):
     """
     A DependencyResource is a resource that is used to indicate that an Output has a dependency on a particular
     resource. These resources are only created when dealing with remote component resources.
     """
 
-    def __init__(self, urn: str) -> None:
-        super().__init__(t="", name="", props={}, opts=None, dependency=True)
+    _dependency_urn: str
 
-        urn_future: asyncio.Future[str] = asyncio.Future()
-        urn_known: asyncio.Future[bool] = asyncio.Future()
-        urn_secret: asyncio.Future[bool] = asyncio.Future()
-        urn_future.set_result(urn)
-        urn_known.set_result(True)
-        urn_secret.set_result(False)
-        self.__dict__["urn"] = Output({self}, urn_future, urn_known, urn_secret)
+    def __init__(self, urn: str) -> None:  # pylint: disable=super-init-not-called
+        self._init_dependency()
+        self._dependency_urn = urn
+
+    @property
+    def urn(self) -> "Output[str]":
+        return _dependency_output(self, "urn", self._dependency_urn)
 
 
 class DependencyProviderResource(ProviderResource):
@@ -1204,31 +1424,24 @@ class DependencyProviderResource(ProviderResource):
     is only used for its reference. Its only valid properties are its URN and ID.
     """
 
-    def __init__(self, ref: str) -> None:
-        ref_urn, ref_id = _parse_resource_reference(ref)
-        urn_parts = urn_util._parse_urn(ref_urn)
+    _dependency_urn: str
+    _dependency_id: str
 
-        # `typ` will be `pulumi:providers:<package>` and we want the
-        # last part, which normally parses as `typ_name`.
-        pkg = urn_parts.typ_name
+    def __init__(self, ref: str) -> None:  # pylint: disable=super-init-not-called
+        ref_urn, ref_id, pkg = _parse_provider_reference(ref)
 
-        super().__init__(pkg=pkg, name="", props={}, opts=None, dependency=True)
+        self._init_dependency()
+        self.package = pkg
+        self._dependency_urn = ref_urn
+        self._dependency_id = ref_id
 
-        urn_future: asyncio.Future[str] = asyncio.Future()
-        urn_known: asyncio.Future[bool] = asyncio.Future()
-        urn_secret: asyncio.Future[bool] = asyncio.Future()
-        urn_future.set_result(ref_urn)
-        urn_known.set_result(True)
-        urn_secret.set_result(False)
-        self.__dict__["urn"] = Output({self}, urn_future, urn_known, urn_secret)
+    @property
+    def urn(self) -> "Output[str]":
+        return _dependency_output(self, "urn", self._dependency_urn)
 
-        id_future: asyncio.Future[str] = asyncio.Future()
-        id_known: asyncio.Future[bool] = asyncio.Future()
-        id_secret: asyncio.Future[bool] = asyncio.Future()
-        id_future.set_result(ref_id)
-        id_known.set_result(True)
-        id_secret.set_result(False)
-        self.__dict__["id"] = Output({self}, id_future, id_known, id_secret)
+    @property
+    def id(self) -> "Output[str]":
+        return _dependency_output(self, "id", self._dependency_id)
 
 
 def export(name: str, value: Any):
@@ -1266,7 +1479,7 @@ def create_urn(
         else:
             parent_urn = Output.from_input(parent)
 
-        parent_prefix = parent_urn.apply(lambda u: u[0 : u.rfind("::")] + "$")
+        parent_prefix = _child_urn_prefix(parent_urn)
     else:
         if stack is None:
             stack = get_stack()
@@ -1276,6 +1489,16 @@ def create_urn(
 
         parent_prefix = Output.from_input("urn:pulumi:" + stack + "::" + project + "::")
 
+    return _create_urn_with_prefix(name, type_, parent_prefix)
+
+
+def _create_urn_with_prefix(
+    name: "Input[str]", type_: "Input[str]", parent_prefix: "Output[str]"
+) -> "Output[str]":
+    """
+    Like create_urn, but takes the prefix contributed by the parent (or the stack and project)
+    precomputed.
+    """
     all_args = [parent_prefix, type_, name]
     # invariant http://mypy.readthedocs.io/en/latest/common_issues.html#variance
     return Output.all(*all_args).apply(lambda arr: arr[0] + arr[1] + "::" + arr[2])  # type: ignore
@@ -1289,3 +1512,23 @@ def _parse_resource_reference(ref: str) -> Tuple[str, str]:
     ref_urn = ref[:last_sep]
     ref_id = ref[last_sep + 2 :]
     return (ref_urn, ref_id)
+
+
+def _parse_provider_reference(ref: str) -> Tuple[str, str, str]:
+    """
+    Parses the URN, ID and package out of the provider reference. This is equivalent to
+    `_parse_resource_reference` followed by `urn._parse_urn(urn).typ_name`, but only splits off the
+    parts of the URN it needs.
+    """
+    last_sep = ref.rindex("::")
+    ref_urn = ref[:last_sep]
+    ref_id = ref[last_sep + 2 :]
+
+    # The type of a provider is `pulumi:providers:<package>`, so the package is its last part.
+    try:
+        qualified_type = ref_urn.split("::", 3)[2]
+    except IndexError as e:
+        raise ValueError(f"Cannot parse URN: {ref_urn}") from e
+    typ_parts = qualified_type.rpartition("$")[2].split(":")
+    pkg = typ_parts[2] if len(typ_parts) > 2 else ""
+    return (ref_urn, ref_id, pkg)
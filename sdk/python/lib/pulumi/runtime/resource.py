@@ -812,7 +812,7 @@ async def _add_dependency(
         # the dependency computation (which is async, so can be interleaved with other
         # operations including child resource construction which adds children to this
         # resource) do not trigger modification during iteration errors.
-        child_resources = res._childResources.copy()
+        child_resources = res._childResources.copy() if res._childResources else ()
         for child in child_resources:
             await _add_dependency(deps, child, from_resource)
         return
@@ -14,7 +14,15 @@
 
 import pytest
 
-from pulumi.automation._remote_workspace import _is_fully_qualified_stack_name
+from pulumi.automation import _remote_workspace
+from pulumi.automation._cmd import CommandResult
+from pulumi.automation._local_workspace import _SKIP_VERSION_CHECK_VAR, LocalWorkspace
+from pulumi.automation._remote_workspace import (
+    RemoteGitAuth,
+    RemoteGitStackSource,
+    _create_local_workspace,
+    _is_fully_qualified_stack_name,
+)
 
 @pytest.mark.parametrize("input,expected", [
     ("owner/project/stack", True),
@@ -25,7 +33,89 @@ from pulumi.automation._remote_workspace import _is_fully_qualified_stack_name
     ("//", False),
     ("///", False),
     ("owner/project/stack/wat", False),
+    ("/project/stack", False),
+    ("owner//stack", False),
+    ("owner/project/", False),
 ])
 def test_config_get_with_defaults(input, expected):
     actual = _is_fully_qualified_stack_name(input)
     assert expected == actual
+
+
+def test_remote_supported_is_cached(monkeypatch):
+    calls = []
+
+    def run_pulumi_cmd(args, cwd, additional_env, on_output=None):
+        calls.append(args)
+        return CommandResult(stdout="  --remote  Run the operation remotely", stderr="", code=0)
+
+    monkeypatch.setattr(_remote_workspace, "_run_pulumi_cmd", run_pulumi_cmd)
+    _remote_workspace._remote_supported.cache_clear()
+    try:
+        assert _remote_workspace._check_remote_cli_support()
+        assert _remote_workspace._check_remote_cli_support()
+        assert len(calls) == 1
+    finally:
+        _remote_workspace._remote_supported.cache_clear()
+
+
+@pytest.mark.parametrize("branch,commit_hash,auth,error", [
+    ("main", "abc123", None, "commit_hash and branch cannot both be specified."),
+    (None, None, None, "at least commit_hash or branch are required."),
+    (None, None, RemoteGitAuth(ssh_private_key="key", ssh_private_key_path="path"),
+     "at least commit_hash or branch are required."),
+    ("main", None, RemoteGitAuth(ssh_private_key="key", ssh_private_key_path="path"),
+     "ssh_private_key and ssh_private_key_path cannot both be specified."),
+])
+def test_create_local_workspace_invalid_git_source(branch, commit_hash, auth, error):
+    with pytest.raises(Exception) as exc_info:
+        _create_local_workspace(url="https://github.com/pulumi/test-repo.git",
+                                branch=branch, commit_hash=commit_hash, auth=auth)
+    assert str(exc_info.value) == error
+
+
+def test_create_remote_stacks_git_source_preserves_order(monkeypatch):
+    created = []
+
+    def create_remote_stack_git_source(stack_name, url, **kwargs):
+        created.append(stack_name)
+        assert kwargs["branch"] == "main"
+        return stack_name
+
+    monkeypatch.setattr(_remote_workspace, "_check_remote_cli_support", lambda: True)
+    monkeypatch.setattr(_remote_workspace, "create_remote_stack_git_source", create_remote_stack_git_source)
+
+    sources = [RemoteGitStackSource(f"owner/project/stack{i}", "https://github.com/pulumi/test-repo.git",
+                                    branch="main")
+               for i in range(8)]
+    stacks = _remote_workspace.create_remote_stacks_git_source(sources)
+
+    assert stacks == [source.stack_name for source in sources]
+    assert sorted(created) == sorted(stacks)
+
+
+def test_create_remote_stacks_git_source_probes_cli_once(monkeypatch):
+    probes = []
+
+    def run_pulumi_cmd(args, cwd, additional_env, on_output=None):
+        probes.append(args)
+        return CommandResult(stdout="  --remote  Run the operation remotely", stderr="", code=0)
+
+    class FakeStack:
+        def __init__(self, stack_name, workspace, mode):
+            self.name = stack_name
+
+    monkeypatch.delenv(_SKIP_VERSION_CHECK_VAR, raising=False)
+    monkeypatch.setattr(_remote_workspace, "_run_pulumi_cmd", run_pulumi_cmd)
+    monkeypatch.setattr(_remote_workspace, "LocalWorkspace", lambda: object.__new__(LocalWorkspace))
+    monkeypatch.setattr(_remote_workspace, "Stack", FakeStack)
+    _remote_workspace._remote_supported.cache_clear()
+    try:
+        sources = [RemoteGitStackSource(f"owner/project/stack{i}", "https://github.com/pulumi/test-repo.git",
+                                        branch="main")
+                   for i in range(8)]
+        stacks = _remote_workspace.create_remote_stacks_git_source(sources)
+        assert len(stacks) == 8
+        assert probes == [["preview", "--help"]]
+    finally:
+        _remote_workspace._remote_supported.cache_clear()
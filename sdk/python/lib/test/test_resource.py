@@ -17,8 +17,9 @@ import asyncio
 import pytest
 import unittest
 
-from pulumi.resource import DependencyProviderResource
+from pulumi.resource import DependencyProviderResource, DependencyResource, urn_type_and_name
 from pulumi.runtime import settings, mocks
+from pulumi.runtime.stack import massage
 from pulumi.runtime.proto import resource_pb2
 import pulumi
 
@@ -32,6 +33,107 @@ class DependencyProviderResourceTests(unittest.TestCase):
         self.assertEqual("aws", res.package)
 
 
+@pulumi.runtime.test
+def test_dependency_resource_outputs():
+    res = DependencyResource("urn:pulumi:stack::project::test:index:res::res")
+    prov = DependencyProviderResource("urn:pulumi:stack::project::pulumi:providers:aws::prov::id1")
+    assert res.urn is res.urn
+    assert prov.id is prov.id
+
+    async def check():
+        assert await res.urn.future() == "urn:pulumi:stack::project::test:index:res::res"
+        assert await prov.urn.future() == "urn:pulumi:stack::project::pulumi:providers:aws::prov"
+        assert await prov.id.future() == "id1"
+        assert prov.package == "aws"
+        for output in (res.urn, prov.urn, prov.id):
+            assert await output.is_known()
+            assert not await output.is_secret()
+
+    return asyncio.ensure_future(check())
+
+
+class UrnTypeAndNameTests(unittest.TestCase):
+    def test_simple(self):
+        self.assertEqual(("res", "aws:s3/bucket:Bucket"),
+                         urn_type_and_name("urn:pulumi:stack::project::aws:s3/bucket:Bucket::res"))
+
+    def test_nested_type(self):
+        self.assertEqual(("child", "test:index:Child"),
+                         urn_type_and_name("urn:pulumi:stack::project::test:index:Parent$test:index:Child::child"))
+
+    def test_name_containing_separator(self):
+        self.assertEqual(("a::b", "t"), urn_type_and_name("urn:pulumi:stack::project::t::a::b"))
+
+
+class StackOutputValueTests(unittest.TestCase):
+    def test_massage_custom_timeouts(self):
+        self.assertEqual({"create": "5m", "update": None, "delete": None},
+                         massage(pulumi.CustomTimeouts(create="5m"), []))
+
+    def test_massage_alias(self):
+        result = massage(pulumi.Alias(name="old", stack="dev"), [])
+        self.assertEqual("old", result["name"])
+        self.assertEqual("dev", result["stack"])
+
+
+class ResourceOptionsMergeTests(unittest.TestCase):
+    def test_merge_leaves_inputs_unchanged(self):
+        opts1 = pulumi.ResourceOptions(protect=True, ignore_changes=["a"])
+        opts2 = pulumi.ResourceOptions(protect=False, ignore_changes=["b"])
+        merged = pulumi.ResourceOptions.merge(opts1, opts2)
+        self.assertIsNot(merged, opts1)
+        self.assertIsNot(merged, opts2)
+        self.assertEqual(True, opts1.protect)
+        self.assertEqual(["a"], opts1.ignore_changes)
+        self.assertEqual(["b"], opts2.ignore_changes)
+
+    def test_options_are_dict_backed(self):
+        opts = pulumi.ResourceOptions(protect=True)
+        opts.extra = "value"
+        self.assertEqual(True, vars(opts)["protect"])
+        self.assertEqual("value", pulumi.ResourceOptions.merge(opts, None).extra)
+
+    def test_merge_slotted_subclass(self):
+        class SlottedOptions(pulumi.ResourceOptions):
+            __slots__ = ("extra",)
+
+        opts = SlottedOptions(protect=True)
+        opts.extra = "value"
+        merged = pulumi.ResourceOptions.merge(opts, pulumi.ResourceOptions(version="1.0"))
+        self.assertIsInstance(merged, SlottedOptions)
+        self.assertEqual("value", merged.extra)
+        self.assertEqual(True, merged.protect)
+        self.assertEqual("1.0", merged.version)
+        self.assertIsNone(opts.version)
+
+    def test_merge_scalars_and_lists(self):
+        opts1 = pulumi.ResourceOptions(protect=True, version="1.0", aliases=["a"])
+        opts2 = pulumi.ResourceOptions(version="2.0", aliases=["b"], retain_on_delete=False)
+        merged = opts1.merge(opts2)
+        self.assertEqual(True, merged.protect)
+        self.assertEqual("2.0", merged.version)
+        self.assertEqual(False, merged.retain_on_delete)
+        self.assertEqual(["a", "b"], merged.aliases)
+
+    def test_merge_providers(self):
+        aws1 = DependencyProviderResource("urn:pulumi:stack::project::pulumi:providers:aws::aws1::id1")
+        aws2 = DependencyProviderResource("urn:pulumi:stack::project::pulumi:providers:aws::aws2::id2")
+        gcp = DependencyProviderResource("urn:pulumi:stack::project::pulumi:providers:gcp::gcp::id3")
+        merged = pulumi.ResourceOptions.merge(
+            pulumi.ResourceOptions(providers=[aws1, gcp]),
+            pulumi.ResourceOptions(providers=[aws2]))
+        self.assertEqual({"aws": aws2, "gcp": gcp}, merged.providers)
+        self.assertIsNone(pulumi.ResourceOptions.merge(None, None).providers)
+
+    def test_merge_provider_maps(self):
+        aws = DependencyProviderResource("urn:pulumi:stack::project::pulumi:providers:aws::aws::id1")
+        gcp = DependencyProviderResource("urn:pulumi:stack::project::pulumi:providers:gcp::gcp::id2")
+        merged = pulumi.ResourceOptions.merge(
+            pulumi.ResourceOptions(providers={"aws": aws}),
+            pulumi.ResourceOptions(providers={"gcp": gcp}))
+        self.assertEqual({"aws": aws, "gcp": gcp}, merged.providers)
+
+
 @pulumi.runtime.test
 def test_depends_on_accepts_outputs(dep_tracker):
     dep1 = MockResource(name='dep1')
@@ -78,6 +180,76 @@ def test_depends_on_respects_top_level_implicit_dependencies(dep_tracker):
     return pulumi.Output.all(dep1.urn, dep2.urn, res.urn).apply(check)
 
 
+@pulumi.runtime.test
+def test_child_shares_parent_providers(dep_tracker):
+    aws = DependencyProviderResource("urn:pulumi:stack::project::pulumi:providers:aws::aws::id1")
+    gcp = DependencyProviderResource("urn:pulumi:stack::project::pulumi:providers:gcp::gcp::id2")
+    parent = pulumi.ComponentResource('python:test:Component', 'parent', None,
+                                      pulumi.ResourceOptions(providers=[aws]))
+    child = MockResource(name='child', opts=pulumi.ResourceOptions(parent=parent))
+    other = MockResource(name='other', opts=pulumi.ResourceOptions(parent=parent, providers=[gcp]))
+    mapped = MockResource(name='mapped', opts=pulumi.ResourceOptions(parent=parent, providers={'gcp': gcp}))
+
+    assert child._providers is parent._providers
+    assert child.get_provider('aws:s3:Bucket') is aws
+    assert other.get_provider('gcp:storage:Bucket') is gcp
+    assert mapped.get_provider('gcp:storage:Bucket') is gcp
+    assert mapped.get_provider('aws:s3:Bucket') is aws
+    assert parent.get_provider('gcp:storage:Bucket') is None
+
+    return pulumi.Output.all(child.urn, other.urn, mapped.urn)
+
+
+@pulumi.runtime.test
+def test_child_uses_overridden_parent_get_provider(dep_tracker):
+    aws = DependencyProviderResource("urn:pulumi:stack::project::pulumi:providers:aws::aws::id1")
+
+    class Component(pulumi.ComponentResource):
+        def get_provider(self, module_member):
+            return aws if module_member.startswith('aws:') else None
+
+    parent = Component('python:test:Component', 'parent')
+    child = pulumi.CustomResource('aws:s3:Bucket', 'child', {}, pulumi.ResourceOptions(parent=parent))
+
+    assert child._provider is aws
+
+    return child.urn
+
+
+@pulumi.runtime.test
+def test_depends_on_component_expands_to_children(dep_tracker):
+    empty = pulumi.ComponentResource('python:test:Component', 'empty')
+    comp = pulumi.ComponentResource('python:test:Component', 'comp')
+    child1 = MockResource(name='child1', opts=pulumi.ResourceOptions(parent=comp))
+    child2 = MockResource(name='child2', opts=pulumi.ResourceOptions(parent=comp))
+    res = MockResource(name='res', opts=pulumi.ResourceOptions(depends_on=[empty, comp]))
+
+    def check(urns):
+        (child1_urn, child2_urn, res_urn) = urns
+        assert set(dep_tracker.dependencies[res_urn]) == set([child1_urn, child2_urn])
+
+    return pulumi.Output.all(child1.urn, child2.urn, res.urn).apply(check)
+
+
+@pulumi.runtime.test
+def test_transformation_args_are_not_shared(dep_tracker):
+    seen = []
+
+    def t1(args):
+        args.props = {"x": "t1-scratch"}
+        return None
+
+    def t2(args):
+        seen.append(dict(args.props))
+        return None
+
+    res = pulumi.CustomResource('python:test:MockResource', 'res', {"x": "orig"},
+                                pulumi.ResourceOptions(transformations=[t1, t2]))
+    assert seen == [{"x": "orig"}]
+
+    return res.urn
+
+
 def promise(x: T) -> Awaitable[T]:
     fut: asyncio.Future[T] = asyncio.Future()
     fut.set_result(x)
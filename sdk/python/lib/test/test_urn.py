@@ -32,3 +32,12 @@ def test_parse_urn_without_name():
     assert res.pkg_name == 'pulumi'
     assert res.mod_name == 'providers'
     assert res.typ_name == 'aws'
+
+
+def test_parse_urn_with_name_containing_separator():
+    res = urn_util._parse_urn('urn:pulumi:stack::project::pulumi:providers:aws::default::4_13_0')
+    assert res.urn_name == 'default::4_13_0'
+    assert res.typ == 'pulumi:providers:aws'
+    assert res.pkg_name == 'pulumi'
+    assert res.mod_name == 'providers'
+    assert res.typ_name == 'aws'